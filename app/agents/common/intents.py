@@ -8,7 +8,9 @@ This module defines:
 - Intent classification utilities
 """
 
+import re
 from enum import Enum
+from functools import lru_cache
 
 
 class AgentType(str, Enum):
@@ -123,6 +125,40 @@ CONFIG_KEYWORDS = [
     "presupuesto para",
 ]
 
+
+def _build_keyword_index(
+    *keyword_lists: list[str],
+) -> tuple[tuple[str, tuple[int, ...], tuple[int, ...]], ...]:
+    """
+    Map each distinct keyword to the positions of the lists containing it.
+    
+    Keywords are ordered by the highest list they belong to, and each entry
+    also carries how many matches per list are still possible after it, so
+    a scan can tell when the remaining keywords can no longer change a score
+    ordering.
+    """
+    index: dict[str, list[int]] = {}
+    for category, keywords in enumerate(keyword_lists):
+        for keyword in keywords:
+            index.setdefault(keyword, []).append(category)
+    ordered = sorted(index.items(), key=lambda item: max(item[1]))
+    
+    entries = []
+    remaining = [0] * len(keyword_lists)
+    for keyword, categories in reversed(ordered):
+        entries.append((keyword, tuple(categories), tuple(remaining)))
+        for category in categories:
+            remaining[category] += 1
+    return tuple(reversed(entries))
+
+
+# Every fast-path keyword once, with the categories it counts toward
+# (0=expense, 1=query, 2=config) and the matches still possible after it,
+# so one scan scores all three categories.
+# Some keywords ("presupuesto", "tarjeta", "card") belong to two of them.
+_KEYWORD_INDEX = _build_keyword_index(EXPENSE_KEYWORDS, QUERY_KEYWORDS, CONFIG_KEYWORDS)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # IVR Flow Keywords (trigger menu-based flows)
 # ─────────────────────────────────────────────────────────────────────────────
@@ -148,6 +184,14 @@ IVR_CARD_KEYWORDS = [
 # Combined IVR keywords for detection
 IVR_KEYWORDS = IVR_BUDGET_KEYWORDS + IVR_TRIP_KEYWORDS + IVR_CARD_KEYWORDS
 
+# IVR flows in detection order, each with a literal that every one of its
+# keywords contains: a message without it cannot match that flow
+_IVR_FLOW_KEYWORDS = (
+    ("budget", "presupuesto", IVR_BUDGET_KEYWORDS),
+    ("trip", "viaj", IVR_TRIP_KEYWORDS),
+    ("card", "tarjeta", IVR_CARD_KEYWORDS),
+)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Special Coordinator Commands
@@ -176,8 +220,16 @@ COORDINATOR_COMMANDS = {
     "status": "show_status",
 }
 
+# str.lower() never shortens text, so anything longer than this once stripped
+# cannot be a command and is rejected without lowercasing it
+_MAX_COMMAND_LENGTH = max(len(command) for command in COORDINATOR_COMMANDS)
+
 # Commands that should always be handled by Coordinator (not passed to agents)
-INTERCEPT_COMMANDS = {"cancelar", "cancel", "menu", "menú", "ayuda", "help", "/reset"}
+INTERCEPT_COMMANDS = frozenset({"cancelar", "cancel", "menu", "menú", "ayuda", "help", "/reset"})
+
+
+# Any digit marks a likely amount ("50 soles taxi")
+_DIGIT_RE = re.compile(r'\d')
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -194,13 +246,15 @@ def is_coordinator_command(message: str) -> tuple[bool, str | None]:
     Returns:
         Tuple of (is_command, command_action)
     """
-    message_lower = message.lower().strip()
+    message_stripped = message.strip()
     
-    # Check exact matches
-    if message_lower in COORDINATOR_COMMANDS:
-        return True, COORDINATOR_COMMANDS[message_lower]
+    # Regular messages are longer than any command
+    if len(message_stripped) > _MAX_COMMAND_LENGTH:
+        return False, None
     
-    return False, None
+    # Exact match on the whole message: one hash lookup
+    action = COORDINATOR_COMMANDS.get(message_stripped.lower())
+    return action is not None, action
 
 
 def count_keywords(message: str, keywords: list[str]) -> int:
@@ -218,6 +272,46 @@ def count_keywords(message: str, keywords: list[str]) -> int:
     return sum(1 for kw in keywords if kw in message_lower)
 
 
+def _count_keyword_categories(
+    message_lower: str,
+    stop_when_decided: bool = False,
+) -> tuple[int, int, int]:
+    """
+    Count expense, query and config keywords in an already-lowercased message.
+    
+    Equivalent to calling count_keywords once per category, but each
+    keyword is searched for only once.
+    
+    With stop_when_decided, the scan ends as soon as detect_intent_fast's
+    expense or query rule has won for good: the leader has at least two
+    matches and more than any other category could still reach. The
+    partial counts returned then route the same way as the full ones.
+    """
+    expense = query = config = 0
+    for keyword, categories, remaining in _KEYWORD_INDEX:
+        if keyword not in message_lower:
+            continue
+        for category in categories:
+            if category == 0:
+                expense += 1
+            elif category == 1:
+                query += 1
+            else:
+                config += 1
+        
+        if stop_when_decided:
+            rest_expense, rest_query, rest_config = remaining
+            if (
+                expense >= 2
+                and expense > query + rest_query
+                and expense > config + rest_config
+            ):
+                break
+            if query >= 2 and query > expense + rest_expense:
+                break
+    return expense, query, config
+
+
 def detect_ivr_flow(message: str) -> str | None:
     """
     Detect which IVR flow to trigger based on keywords.
@@ -228,20 +322,18 @@ def detect_ivr_flow(message: str) -> str | None:
     Returns:
         Flow name ("budget", "trip", "card") or None
     """
-    message_lower = message.lower()
-    
-    # Check each IVR flow type
-    for keyword in IVR_BUDGET_KEYWORDS:
-        if keyword in message_lower:
-            return "budget"
-    
-    for keyword in IVR_TRIP_KEYWORDS:
-        if keyword in message_lower:
-            return "trip"
-    
-    for keyword in IVR_CARD_KEYWORDS:
-        if keyword in message_lower:
-            return "card"
+    return _detect_ivr_flow_lower(message.lower())
+
+
+def _detect_ivr_flow_lower(message_lower: str) -> str | None:
+    """detect_ivr_flow for a message that is already lowercased."""
+    # Check each IVR flow type, skipping flows whose shared literal is absent
+    for flow, required, keywords in _IVR_FLOW_KEYWORDS:
+        if required not in message_lower:
+            continue
+        for keyword in keywords:
+            if keyword in message_lower:
+                return flow
     
     return None
 
@@ -259,22 +351,28 @@ def detect_intent_fast(message: str) -> AgentType | None:
     Returns:
         AgentType if confidently detected, None if ambiguous
     """
-    message_lower = message.lower()
-    
+    # Case and surrounding whitespace never change the outcome, so repeated
+    # messages share one cache entry regardless of them
+    return _detect_intent_fast_cached(message.strip().lower())
+
+
+@lru_cache(maxsize=2048)
+def _detect_intent_fast_cached(message_lower: str) -> AgentType | None:
+    """Keyword routing behind detect_intent_fast, on a normalized message."""
     # Check if it's a coordinator command first
-    is_cmd, _ = is_coordinator_command(message)
+    is_cmd, _ = is_coordinator_command(message_lower)
     if is_cmd:
         return AgentType.COORDINATOR
     
     # Check for IVR flow keywords (menu-based configuration)
-    ivr_flow = detect_ivr_flow(message)
+    ivr_flow = _detect_ivr_flow_lower(message_lower)
     if ivr_flow:
         return AgentType.IVR
     
     # Count keywords for each agent type
-    expense_score = count_keywords(message_lower, EXPENSE_KEYWORDS)
-    query_score = count_keywords(message_lower, QUERY_KEYWORDS)
-    config_score = count_keywords(message_lower, CONFIG_KEYWORDS)
+    expense_score, query_score, config_score = _count_keyword_categories(
+        message_lower, stop_when_decided=True
+    )
     
     # Clear winner: expense keywords
     if expense_score >= 2 and expense_score > query_score and expense_score > config_score:
@@ -292,23 +390,24 @@ def detect_intent_fast(message: str) -> AgentType | None:
     # Single strong expense indicator (common pattern: "50 soles taxi")
     if expense_score == 1 and query_score == 0 and config_score == 0:
         # Check if message contains a number (likely expense)
-        import re
-        if re.search(r'\d+', message):
+        if _DIGIT_RE.search(message_lower):
             return AgentType.IE
     
     # Ambiguous - needs LLM
     return None
 
 
+_AGENT_DESCRIPTIONS = {
+    AgentType.CONFIGURATION: "Configuración (viajes, tarjetas, presupuestos) - LLM",
+    AgentType.IVR: "Configuración rápida (onboarding, presupuestos, viajes, tarjetas)",
+    AgentType.IE: "Registro de gastos",
+    AgentType.COACH: "Consultas y reportes financieros",
+    AgentType.COORDINATOR: "Coordinador",
+    AgentType.UNKNOWN: "Desconocido",
+}
+
+
 def get_agent_description(agent_type: AgentType) -> str:
     """Get human-readable description of an agent."""
-    descriptions = {
-        AgentType.CONFIGURATION: "Configuración (viajes, tarjetas, presupuestos) - LLM",
-        AgentType.IVR: "Configuración rápida (onboarding, presupuestos, viajes, tarjetas)",
-        AgentType.IE: "Registro de gastos",
-        AgentType.COACH: "Consultas y reportes financieros",
-        AgentType.COORDINATOR: "Coordinador",
-        AgentType.UNKNOWN: "Desconocido",
-    }
-    return descriptions.get(agent_type, "Desconocido")
+    return _AGENT_DESCRIPTIONS.get(agent_type, "Desconocido")
 
@@ -6,6 +6,7 @@ Uses LLM to detect user intent and extract entities from messages.
 
 import json
 import re
+from functools import lru_cache
 
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
@@ -15,9 +16,61 @@ from app.config import settings
 from app.logging_config import get_logger
 from app.prompts.configuration_agent import INTENT_DETECTION_PROMPT
 
+# orjson (installed with langsmith) parses small objects several times faster;
+# its JSONDecodeError subclasses json.JSONDecodeError, so handlers stay the same
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover
+    from json import loads as _json_loads
+
 logger = get_logger(__name__)
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Quick-detection lexicons (built once at import)
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Matched as substrings of the lowercased message
+_CONFIRM_WORDS = ("sí", "si", "yes", "s", "y", "ok", "dale", "correcto", "confirmo", "confirmar", "de acuerdo", "está bien", "claro")
+_DENY_WORDS = ("no", "cancelar", "cancel", "cambiar", "incorrecto", "mal")
+_TRIP_KEYWORDS = ("nuevo viaje", "crear viaje", "configurar viaje", "planear viaje")
+_BUDGET_KEYWORDS = ("presupuesto", "budget", "configurar presupuesto")
+_CARD_KEYWORDS = ("agregar tarjeta", "nueva tarjeta", "registrar tarjeta")
+_ONBOARDING_CURRENCIES = ("usd", "cop", "mxn", "eur", "pen", "clp", "ars", "brl", "gbp")
+_TIMEZONE_PATTERNS = ("america/", "europe/", "asia/", "gmt", "utc")
+
+
+def _drop_redundant_substrings(words: tuple[str, ...]) -> tuple[str, ...]:
+    """
+    Drop words that contain another word of the same tuple.
+    
+    For an any(word in text) probe these can never decide the result:
+    "configurar presupuesto" is only found where "presupuesto" already is.
+    """
+    return tuple(
+        word for word in words
+        if not any(other != word and other in word for other in words)
+    )
+
+
+# Minimal probe sets for the any(...) substring checks; "s" and "y" alone
+# cover most of the confirmation words
+_CONFIRM_PROBES = _drop_redundant_substrings(_CONFIRM_WORDS)
+_DENY_PROBES = _drop_redundant_substrings(_DENY_WORDS)
+_TRIP_PROBES = _drop_redundant_substrings(_TRIP_KEYWORDS)
+_BUDGET_PROBES = _drop_redundant_substrings(_BUDGET_KEYWORDS)
+_CARD_PROBES = _drop_redundant_substrings(_CARD_KEYWORDS)
+
+# Matched against the whole lowercased message
+_HELP_MESSAGES = frozenset({"ayuda", "help", "?", "que puedes hacer"})
+_GREETING_MESSAGES = frozenset({"hola", "hi", "hello", "buenas", "buenos días", "buenas tardes"})
+_NON_NAME_WORDS = frozenset({"sí", "si", "no", "ok", "hola", "ayuda", "help", "cancelar"})
+
+# JSON object inside a markdown code fence, and a bare (non-nested) JSON object
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'\{[^{}]*\}')
+
+
 def detect_intent_node(state: ConfigurationAgentState) -> ConfigurationAgentState:
     """
     Detect user intent and extract entities using LLM.
@@ -120,17 +173,47 @@ def _quick_intent_detection(
     """
     Quick pattern-based intent detection for common cases.
     
+    Results are memoized per (message, current_flow, pending_field); each call
+    returns a fresh dict so callers may modify it.
+    
     Returns intent dict or None if LLM should be used.
     """
-    message_lower = message.lower().strip()
+    cached = _quick_intent_cached(message, current_flow, pending_field)
+    if cached is None:
+        return None
+    intent, entities = cached
+    return {"intent": intent, "entities": dict(entities)}
+
+
+@lru_cache(maxsize=4096)
+def _quick_intent_cached(
+    message: str,
+    current_flow: str,
+    pending_field: str | None
+) -> tuple[str, tuple[tuple[str, str], ...]] | None:
+    """Hashable, cacheable form of _match_quick_intent's result."""
+    result = _match_quick_intent(message, current_flow, pending_field)
+    if result is None:
+        return None
+    return result["intent"], tuple(result["entities"].items())
+
+
+def _match_quick_intent(
+    message: str,
+    current_flow: str,
+    pending_field: str | None
+) -> dict | None:
+    """
+    Pattern matching behind _quick_intent_detection (uncached).
     
-    # Confirmation patterns - check for phrases that contain confirmations
-    confirm_words = ["sí", "si", "yes", "s", "y", "ok", "dale", "correcto", "confirmo", "confirmar", "de acuerdo", "está bien", "claro"]
-    deny_words = ["no", "cancelar", "cancel", "cambiar", "incorrecto", "mal"]
+    Keyed on the raw message rather than a normalized one: extracted names
+    and timezones keep the user's original text.
+    """
+    message_lower = message.lower().strip()
     
     # Check if message is primarily a confirmation (contains confirm words but not deny words)
-    has_confirm = any(word in message_lower for word in confirm_words)
-    has_deny = any(word in message_lower for word in deny_words)
+    has_confirm = any(word in message_lower for word in _CONFIRM_PROBES)
+    has_deny = any(word in message_lower for word in _DENY_PROBES)
     
     # If it's a short message with confirmation words and no deny words, it's a confirm
     if has_confirm and not has_deny and len(message_lower.split()) <= 4:
@@ -141,26 +224,23 @@ def _quick_intent_detection(
         return {"intent": "deny", "entities": {}}
     
     # Help patterns
-    if message_lower in ["ayuda", "help", "?", "que puedes hacer"]:
+    if message_lower in _HELP_MESSAGES:
         return {"intent": "help", "entities": {}}
     
     # Greeting patterns
-    if message_lower in ["hola", "hi", "hello", "buenas", "buenos días", "buenas tardes"]:
+    if message_lower in _GREETING_MESSAGES:
         return {"intent": "greeting", "entities": {}}
     
     # Trip creation patterns
-    trip_keywords = ["nuevo viaje", "crear viaje", "configurar viaje", "planear viaje"]
-    if any(kw in message_lower for kw in trip_keywords):
+    if any(kw in message_lower for kw in _TRIP_PROBES):
         return {"intent": "trip_create", "entities": {}}
     
     # Budget patterns
-    budget_keywords = ["presupuesto", "budget", "configurar presupuesto"]
-    if any(kw in message_lower for kw in budget_keywords):
+    if any(kw in message_lower for kw in _BUDGET_PROBES):
         return {"intent": "budget_create", "entities": {}}
     
     # Card patterns
-    card_keywords = ["agregar tarjeta", "nueva tarjeta", "registrar tarjeta"]
-    if any(kw in message_lower for kw in card_keywords):
+    if any(kw in message_lower for kw in _CARD_PROBES):
         return {"intent": "card_add", "entities": {}}
     
     # ─────────────────────────────────────────────────────────────────────────
@@ -192,8 +272,7 @@ def _quick_intent_detection(
     # During onboarding, try to extract specific entities
     if current_flow == "onboarding":
         # Check for currency codes (fallback if not from menu)
-        currencies = ["usd", "cop", "mxn", "eur", "pen", "clp", "ars", "brl", "gbp"]
-        for curr in currencies:
+        for curr in _ONBOARDING_CURRENCIES:
             if curr in message_lower or curr.upper() in message:
                 return {
                     "intent": "onboarding_provide_currency",
@@ -201,8 +280,7 @@ def _quick_intent_detection(
                 }
         
         # Check for timezone patterns (explicit timezone format)
-        timezone_patterns = ["america/", "europe/", "asia/", "gmt", "utc"]
-        if any(tz in message_lower for tz in timezone_patterns):
+        if any(tz in message_lower for tz in _TIMEZONE_PATTERNS):
             tz_value = message.strip()
             return {
                 "intent": "onboarding_provide_timezone",
@@ -215,8 +293,7 @@ def _quick_intent_detection(
             # Only accept if it looks like a name (not numbers, not too short)
             if len(message) >= 2 and len(message) < 50 and not message.isdigit():
                 # Exclude confirmations and other patterns
-                non_name_words = ["sí", "si", "no", "ok", "hola", "ayuda", "help", "cancelar"]
-                if message_lower not in non_name_words:
+                if message_lower not in _NON_NAME_WORDS:
                     return {
                         "intent": "onboarding_provide_name",
                         "entities": {"name": message.strip()}
@@ -239,25 +316,27 @@ def _parse_llm_response(content: str) -> dict:
     # Try to extract JSON from response
     try:
         # Direct parse
-        return json.loads(content)
+        return _json_loads(content)
     except json.JSONDecodeError:
         pass
     
-    # Try to find JSON in markdown code blocks
-    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
-    if json_match:
-        try:
-            return json.loads(json_match.group(1))
-        except json.JSONDecodeError:
-            pass
-    
-    # Try to find any JSON object
-    json_match = re.search(r'\{[^{}]*\}', content)
-    if json_match:
-        try:
-            return json.loads(json_match.group())
-        except json.JSONDecodeError:
-            pass
+    # No object anywhere (plain-text reply): skip the regex scans
+    if "{" in content:
+        # Try to find JSON in markdown code blocks
+        json_match = _JSON_FENCE_RE.search(content)
+        if json_match:
+            try:
+                return _json_loads(json_match.group(1))
+            except json.JSONDecodeError:
+                pass
+        
+        # Try to find any JSON object
+        json_match = _JSON_OBJECT_RE.search(content)
+        if json_match:
+            try:
+                return _json_loads(json_match.group())
+            except json.JSONDecodeError:
+                pass
     
     # Return default
     logger.warning("failed_to_parse_llm_response", content_preview=content[:100])
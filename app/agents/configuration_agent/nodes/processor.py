@@ -10,6 +10,27 @@ from app.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Onboarding lookup tables (built once at import)
+# A tuple, not a set: LLM-extracted entities may be unhashable
+_VALID_CURRENCIES = ("USD", "COP", "MXN", "EUR", "PEN", "CLP", "ARS", "BRL", "GBP")
+# Intents answered by their own onboarding branch, never read as a timezone
+_NON_TIMEZONE_INTENTS = frozenset({"confirm", "deny", "greeting", "help"})
+# City/country mentions accepted as a timezone fallback, checked in order
+_CITY_TO_TIMEZONE = {
+    "santiago": "America/Santiago",
+    "chile": "America/Santiago",
+    "bogota": "America/Bogota",
+    "bogotá": "America/Bogota",
+    "colombia": "America/Bogota",
+    "lima": "America/Lima",
+    "peru": "America/Lima",
+    "perú": "America/Lima",
+    "mexico": "America/Mexico_City",
+    "méxico": "America/Mexico_City",
+    "buenos aires": "America/Argentina/Buenos_Aires",
+    "argentina": "America/Argentina/Buenos_Aires",
+}
+
 
 def process_flow_node(state: ConfigurationAgentState) -> ConfigurationAgentState:
     """
@@ -101,8 +122,7 @@ def _process_onboarding(
             currency = CURRENCY_MAP.get(msg.lower()) or CURRENCY_MAP.get(msg[0] if msg else "")
         
         # Validate currency
-        valid_currencies = ["USD", "COP", "MXN", "EUR", "PEN", "CLP", "ARS", "BRL", "GBP"]
-        if not currency or currency not in valid_currencies:
+        if not currency or currency not in _VALID_CURRENCIES:
             return {
                 **state,
                 "flow_data": flow_data,
@@ -149,7 +169,7 @@ def _process_onboarding(
     should_process_timezone = (
         intent == "onboarding_provide_timezone" or 
         pending_field == "timezone_manual" or 
-        (pending_field == "timezone" and intent not in ["confirm", "deny", "greeting", "help"])
+        (pending_field == "timezone" and intent not in _NON_TIMEZONE_INTENTS)
     )
     
     if should_process_timezone:
@@ -167,22 +187,7 @@ def _process_onboarding(
         
         # If still no timezone, check for city/country mentions as fallback
         if not tz:
-            city_to_timezone = {
-                "santiago": "America/Santiago",
-                "chile": "America/Santiago",
-                "bogota": "America/Bogota",
-                "bogotá": "America/Bogota",
-                "colombia": "America/Bogota",
-                "lima": "America/Lima",
-                "peru": "America/Lima",
-                "perú": "America/Lima",
-                "mexico": "America/Mexico_City",
-                "méxico": "America/Mexico_City",
-                "buenos aires": "America/Argentina/Buenos_Aires",
-                "argentina": "America/Argentina/Buenos_Aires",
-            }
-            
-            for city, tz_value in city_to_timezone.items():
+            for city, tz_value in _CITY_TO_TIMEZONE.items():
                 if city in message_body:
                     tz = tz_value
                     break
@@ -377,10 +382,11 @@ def _parse_amount(value: str) -> str:
     """Parse amount string, removing currency symbols and formatting."""
     if not value:
         return "0"
-    # Remove common currency symbols and formatting
-    cleaned = value.replace("$", "").replace(",", "").replace(".", "").strip()
-    # Keep only digits
-    digits = "".join(c for c in cleaned if c.isdigit())
+    # Plain digit strings (menu and prompt answers) need no cleaning
+    if value.isdigit():
+        return value
+    # Keep only digits: drops currency symbols, separators and whitespace in one pass
+    digits = "".join(filter(str.isdigit, value))
     return digits if digits else "0"
 
 
@@ -915,6 +915,18 @@ async def update_state_node(state: CoordinatorState) -> CoordinatorState:
 # Helper Functions
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Lowercased agent names (and aliases) stored in sessions, built once
+_AGENT_STRING_MAP = {
+    "configuration": AgentType.CONFIGURATION,
+    "config": AgentType.CONFIGURATION,
+    "ie": AgentType.IE,
+    "expense": AgentType.IE,
+    "coach": AgentType.COACH,
+    "query": AgentType.COACH,
+    "coordinator": AgentType.COORDINATOR,
+}
+
+
 def _map_agent_string(agent_str: str | None) -> AgentType:
     """Map agent string to AgentType."""
     if not agent_str:
@@ -926,16 +938,7 @@ def _map_agent_string(agent_str: str | None) -> AgentType:
     if agent_lower.startswith("ivr"):
         return AgentType.IVR
     
-    mapping = {
-        "configuration": AgentType.CONFIGURATION,
-        "config": AgentType.CONFIGURATION,
-        "ie": AgentType.IE,
-        "expense": AgentType.IE,
-        "coach": AgentType.COACH,
-        "query": AgentType.COACH,
-        "coordinator": AgentType.COORDINATOR,
-    }
-    return mapping.get(agent_lower, AgentType.UNKNOWN)
+    return _AGENT_STRING_MAP.get(agent_lower, AgentType.UNKNOWN)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -42,8 +42,17 @@ from app.prompts.coordinator import (
 
 logger = get_logger(__name__)
 
+# Substring lexicons for _quick_intent_change_check (built once at import)
+_QUESTION_INDICATORS = ("cuánto", "cuanto", "qué", "que", "cómo", "como")
+_EXPENSE_CLARIFICATIONS = ("gastó", "gasto", "pagué")
+_EXPENSE_INDICATORS = ("gasté", "gaste", "pagué", "pague", "compré", "compre")
+_CONFIG_EXPENSE_INDICATORS = ("gasté", "gaste", "pagué", "pague")
 
-@dataclass
+# Any digit marks a likely amount
+_DIGIT_RE = re.compile(r'\d')
+
+
+@dataclass(slots=True, frozen=True)
 class RoutingResult:
     """Result of intent routing."""
     
@@ -69,7 +78,7 @@ class RoutingResult:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IntentChangeResult:
     """Result of intent change detection."""
     
@@ -364,9 +373,9 @@ class IntentRouter:
         # Currently in expense flow
         if current_agent == "ie":
             # Check if user is asking a question
-            if any(kw in message_lower for kw in ["cuánto", "cuanto", "qué", "que", "cómo", "como"]):
+            if any(kw in message_lower for kw in _QUESTION_INDICATORS):
                 # But not if it's clarifying the expense
-                if not any(kw in message_lower for kw in ["gastó", "gasto", "pagué", "pagué"]):
+                if not any(kw in message_lower for kw in _EXPENSE_CLARIFICATIONS):
                     return IntentChangeResult(
                         should_change=True,
                         new_agent=AgentType.COACH,
@@ -377,10 +386,9 @@ class IntentRouter:
         # Currently in query flow
         if current_agent == "coach":
             # Check if user is logging an expense
-            expense_indicators = ["gasté", "gaste", "pagué", "pague", "compré", "compre"]
-            if any(kw in message_lower for kw in expense_indicators):
+            if any(kw in message_lower for kw in _EXPENSE_INDICATORS):
                 # Check for number
-                if re.search(r'\d+', message):
+                if _DIGIT_RE.search(message):
                     return IntentChangeResult(
                         should_change=True,
                         new_agent=AgentType.IE,
@@ -391,8 +399,7 @@ class IntentRouter:
         # Currently in configuration flow
         if current_agent == "configuration":
             # Check for clear expense
-            expense_indicators = ["gasté", "gaste", "pagué", "pague"]
-            if any(kw in message_lower for kw in expense_indicators) and re.search(r'\d+', message):
+            if any(kw in message_lower for kw in _CONFIG_EXPENSE_INDICATORS) and _DIGIT_RE.search(message):
                 return IntentChangeResult(
                     should_change=True,
                     new_agent=AgentType.IE,
@@ -2,9 +2,14 @@
 Router node for IE Agent.
 
 Determines the input type and routes to the appropriate extraction node.
+
+If the incoming state already carries a ``content_hash`` it is trusted and
+reused; callers that pre-compute it must use the SHA256 hex digest of
+``raw_input`` (see ``compute_content_hash``).
 """
 
 import hashlib
+from functools import lru_cache
 from typing import Literal
 
 from app.agents.ie_agent.state import IEAgentState, InputType
@@ -18,6 +23,62 @@ IMAGE_MIME_TYPES = {"image/jpeg", "image/jpg", "image/png", "image/gif", "image/
 AUDIO_MIME_TYPES = {"audio/ogg", "audio/mpeg", "audio/mp3", "audio/wav", "audio/webm", "audio/m4a", "audio/aac"}
 DOCUMENT_MIME_TYPES = {"application/pdf"}
 
+# Single lookup table built from the MIME sets above
+_MIME_TO_TYPE: dict[str, InputType] = {
+    **{mime: "image" for mime in IMAGE_MIME_TYPES},
+    **{mime: "audio" for mime in AUDIO_MIME_TYPES},
+    **{mime: "receipt" for mime in DOCUMENT_MIME_TYPES},
+}
+
+# Filename extensions used when no MIME type is available
+_EXT_TO_TYPE: dict[str, InputType] = {
+    "jpg": "image",
+    "jpeg": "image",
+    "png": "image",
+    "gif": "image",
+    "webp": "image",
+    "ogg": "audio",
+    "mp3": "audio",
+    "wav": "audio",
+    "webm": "audio",
+    "m4a": "audio",
+    "mpeg": "audio",
+    "pdf": "receipt",
+}
+
+# Leading bytes of supported formats, used when MIME type and filename miss
+_FILE_SIGNATURES: tuple[tuple[bytes, InputType], ...] = (
+    (b"%PDF", "receipt"),
+    (b"\xff\xd8\xff", "image"),  # JPEG
+    (b"\x89PNG", "image"),
+    (b"GIF8", "image"),
+    (b"OggS", "audio"),
+    (b"ID3", "audio"),  # MP3 with ID3 tag
+    (b"\xff\xfb", "audio"),  # MP3 frame without tag
+)
+
+# RIFF containers carry their format at bytes 8-12
+_RIFF_FORMATS: dict[bytes, InputType] = {
+    b"WEBP": "image",
+    b"WAVE": "audio",
+}
+
+
+def _file_extension(filename: str) -> str:
+    """Return the text after the last dot in filename, or "" if there is none."""
+    dot = filename.rfind(".")
+    return filename[dot + 1:] if dot >= 0 else ""
+
+
+def _detect_by_signature(data: bytes) -> InputType:
+    """Detect the input type from the file signature (magic bytes)."""
+    if data.startswith(b"RIFF"):
+        return _RIFF_FORMATS.get(data[8:12], "unknown")
+    for signature, input_type in _FILE_SIGNATURES:
+        if data.startswith(signature):
+            return input_type
+    return "unknown"
+
 
 def detect_input_type(state: IEAgentState) -> InputType:
     """
@@ -27,7 +88,8 @@ def detect_input_type(state: IEAgentState) -> InputType:
     1. If input_type is already set and not 'unknown', use it
     2. If raw_input is string, it's text
     3. If raw_input is bytes, check file_type/filename
-    4. Default to 'unknown'
+    4. If both are missing or unrecognized, check the file signature
+    5. Default to 'unknown'
     
     Args:
         state: Current agent state
@@ -47,37 +109,62 @@ def detect_input_type(state: IEAgentState) -> InputType:
     
     # Bytes input = check MIME type
     if isinstance(raw_input, bytes):
-        file_type = (state.get("file_type") or "").lower()
-        filename = (state.get("filename") or "").lower()
+        # Drop MIME parameters such as "; codecs=opus" before matching
+        file_type = (state.get("file_type") or "").partition(";")[0].strip().lower()
         
         # Check by MIME type
-        if file_type:
-            if file_type in IMAGE_MIME_TYPES:
-                return "image"
-            if file_type in AUDIO_MIME_TYPES:
-                return "audio"
-            if file_type in DOCUMENT_MIME_TYPES:
-                return "receipt"
+        mime_input_type = _MIME_TO_TYPE.get(file_type)
+        if mime_input_type:
+            return mime_input_type
         
-        # Check by filename extension
+        # Check by filename extension (only normalized when MIME type missed)
+        filename = (state.get("filename") or "").lower()
         if filename:
-            ext = filename.split(".")[-1] if "." in filename else ""
-            if ext in {"jpg", "jpeg", "png", "gif", "webp"}:
-                return "image"
-            if ext in {"ogg", "mp3", "wav", "webm", "m4a", "mpeg"}:
-                return "audio"
-            if ext == "pdf":
-                return "receipt"
+            ext_input_type = _EXT_TO_TYPE.get(_file_extension(filename))
+            if ext_input_type:
+                return ext_input_type
+        
+        # Check by file signature
+        return _detect_by_signature(raw_input)
     
     return "unknown"
 
 
-def compute_content_hash(raw_input: str | bytes | None) -> str | None:
+# Empty SHA256 context; copied for each digest instead of constructing a new one
+_SHA256_PROTOTYPE = hashlib.sha256()
+
+
+def _sha256_hexdigest(data: bytes | bytearray | memoryview) -> str:
+    """SHA256 hex digest of data using a copy of the shared empty context."""
+    digest = _SHA256_PROTOTYPE.copy()
+    digest.update(data)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=256)
+def _hash_text(text: str) -> str:
+    """
+    SHA256 hex digest of a text message, memoized.
+    
+    Retries and graph replays route the same message again; ``str`` caches its
+    own hash, so a repeat lookup costs a dict probe instead of a full digest.
+    Only text is cached - file bytes can be megabytes and are not retained.
+    """
+    return _sha256_hexdigest(text.encode("utf-8"))
+
+
+def compute_content_hash(raw_input: str | bytes | bytearray | memoryview | None) -> str | None:
     """
     Compute SHA256 hash of input content.
     
+    The digest is persisted in ``Expense.source_meta`` and compared against
+    stored values for duplicate detection, so the algorithm must stay SHA256.
+    
+    Bytes-like input is hashed through the buffer protocol without copying,
+    and hashlib releases the GIL while digesting large payloads.
+    
     Args:
-        raw_input: Text or bytes content
+        raw_input: Text or bytes-like content
         
     Returns:
         Hex digest or None if no input
@@ -86,11 +173,9 @@ def compute_content_hash(raw_input: str | bytes | None) -> str | None:
         return None
     
     if isinstance(raw_input, str):
-        data = raw_input.encode("utf-8")
-    else:
-        data = raw_input
+        return _hash_text(raw_input)
     
-    return hashlib.sha256(data).hexdigest()
+    return _sha256_hexdigest(raw_input)
 
 
 def router_node(state: IEAgentState) -> IEAgentState:
@@ -99,7 +184,7 @@ def router_node(state: IEAgentState) -> IEAgentState:
     
     This is the first node in the graph. It:
     1. Detects the input type (text, audio, image, receipt)
-    2. Computes content hash for idempotency
+    2. Computes content hash for idempotency (reusing an existing one)
     3. Updates state with routing information
     
     Args:
@@ -117,11 +202,16 @@ def router_node(state: IEAgentState) -> IEAgentState:
         has_raw_input=state.get("raw_input") is not None,
     )
     
-    # Detect input type
-    detected_type = detect_input_type(state)
+    raw_input = state.get("raw_input")
+    
+    # Detect input type (text messages skip the MIME/filename checks)
+    if isinstance(raw_input, str) and state.get("input_type") in (None, "unknown", "text"):
+        detected_type = "text"
+    else:
+        detected_type = detect_input_type(state)
     
-    # Compute content hash
-    content_hash = compute_content_hash(state.get("raw_input"))
+    # Compute content hash unless an upstream caller already did
+    content_hash = state.get("content_hash") or compute_content_hash(raw_input)
     
     logger.info(
         "router_node_complete",
@@ -130,13 +220,20 @@ def router_node(state: IEAgentState) -> IEAgentState:
         content_hash=content_hash[:16] if content_hash else None,
     )
     
-    # Return updated state
-    return {
-        **state,
-        "input_type": detected_type,
-        "content_hash": content_hash,
-        "status": "routing",
-    }
+    # Update in place: LangGraph hands each node its own copy of the state
+    state["input_type"] = detected_type
+    state["content_hash"] = content_hash
+    state["status"] = "routing"
+    return state
+
+
+# Extraction node for each input type; anything else routes to "error"
+_EXTRACTION_ROUTES: dict[str, Literal["extract_text", "extract_audio", "extract_image"]] = {
+    "text": "extract_text",
+    "audio": "extract_audio",
+    "image": "extract_image",
+    "receipt": "extract_image",  # Receipts use same extraction as images
+}
 
 
 def get_extraction_route(state: IEAgentState) -> Literal["extract_text", "extract_audio", "extract_image", "error"]:
@@ -152,15 +249,7 @@ def get_extraction_route(state: IEAgentState) -> Literal["extract_text", "extrac
         Name of the next node to execute
     """
     input_type = state.get("input_type", "unknown")
-    
-    routing_map = {
-        "text": "extract_text",
-        "audio": "extract_audio",
-        "image": "extract_image",
-        "receipt": "extract_image",  # Receipts use same extraction as images
-    }
-    
-    route = routing_map.get(input_type, "error")
+    route = _EXTRACTION_ROUTES.get(input_type, "error")
     
     logger.debug(
         "routing_decision",
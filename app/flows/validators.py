@@ -224,27 +224,29 @@ def validate_amount(input_text: str) -> ValidationResult:
     """
     text = input_text.strip()
     
-    # Remove currency symbols and spaces
-    text = text.replace("$", "").replace("€", "").replace(" ", "")
-    
-    # Handle thousand separators
-    # If there's both comma and dot, determine which is the decimal separator
-    if "," in text and "." in text:
-        # Assume last separator is decimal
-        if text.rfind(",") > text.rfind("."):
-            # Comma is decimal separator (European: 1.000,50)
-            text = text.replace(".", "").replace(",", ".")
-        else:
-            # Dot is decimal separator (US: 1,000.50)
-            text = text.replace(",", "")
-    elif "," in text:
-        # Could be thousand separator or decimal
-        # If there are 3 digits after comma, it's a thousand separator
-        parts = text.split(",")
-        if len(parts[-1]) == 3:
-            text = text.replace(",", "")
-        else:
-            text = text.replace(",", ".")
+    # Plain digit replies (the common case) need no symbol/separator cleanup
+    if not text.isdecimal():
+        # Remove currency symbols and spaces
+        text = text.replace("$", "").replace("€", "").replace(" ", "")
+    
+        # Handle thousand separators
+        # If there's both comma and dot, determine which is the decimal separator
+        if "," in text and "." in text:
+            # Assume last separator is decimal
+            if text.rfind(",") > text.rfind("."):
+                # Comma is decimal separator (European: 1.000,50)
+                text = text.replace(".", "").replace(",", ".")
+            else:
+                # Dot is decimal separator (US: 1,000.50)
+                text = text.replace(",", "")
+        elif "," in text:
+            # Could be thousand separator or decimal
+            # If there are 3 digits after comma, it's a thousand separator
+            parts = text.split(",")
+            if len(parts[-1]) == 3:
+                text = text.replace(",", "")
+            else:
+                text = text.replace(",", ".")
     
     try:
         amount = Decimal(text)
@@ -9,12 +9,13 @@ Provides:
 
 import os
 import uuid
+from contextlib import contextmanager
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Generator
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, insert, text
 from sqlalchemy.orm import Session, sessionmaker
 
 # Set test environment before importing app modules
@@ -43,6 +44,10 @@ from app.models import (
 # Database Fixtures
 # ─────────────────────────────────────────────────────────────────────────────
 
+# Arbitrary application-wide key for the schema-creation advisory lock
+_SCHEMA_LOCK_KEY = 7_310_420_001
+
+
 @pytest.fixture(scope="session")
 def engine():
     """
@@ -71,8 +76,11 @@ def engine():
     
     engine = create_engine(db_url, echo=False)
     
-    # Create all tables for tests (if they don't exist)
-    Base.metadata.create_all(engine)
+    # Create all tables for tests (if they don't exist). pytest-xdist workers
+    # share the database, so take an advisory lock to create them one at a time
+    with engine.begin() as connection:
+        connection.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_LOCK_KEY})
+        Base.metadata.create_all(connection)
     
     yield engine
     
@@ -80,17 +88,19 @@ def engine():
     # Use a fresh test database or run migrations for cleanup.
 
 
-@pytest.fixture(scope="function")
-def db(engine) -> Generator[Session, None, None]:
+@contextmanager
+def _rollback_session(engine) -> Generator[Session, None, None]:
     """
-    Create a fresh database session for each test.
+    Open a session whose writes are all rolled back on exit.
     
-    Rolls back all changes after the test completes.
+    The session works inside a SAVEPOINT of an outer transaction, so
+    commit() (from fixtures or app code) only releases the savepoint and
+    rollback() cannot end the outer transaction.
     """
     connection = engine.connect()
     transaction = connection.begin()
     
-    SessionLocal = sessionmaker(bind=connection)
+    SessionLocal = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     session = SessionLocal()
     
     try:
@@ -101,62 +111,64 @@ def db(engine) -> Generator[Session, None, None]:
         connection.close()
 
 
+@pytest.fixture(scope="function")
+def db(engine) -> Generator[Session, None, None]:
+    """
+    Create a fresh database session for each test.
+    
+    Rolls back all changes after the test completes.
+    """
+    with _rollback_session(engine) as session:
+        yield session
+
+
+@pytest.fixture(scope="module")
+def module_db(engine) -> Generator[Session, None, None]:
+    """
+    Create a session shared by a module's tests.
+    
+    For modules whose setup rows (e.g. a module-scoped user) are costly to
+    rebuild per test. Everything is rolled back when the module finishes;
+    use module_db_savepoint to also undo each test's writes.
+    """
+    with _rollback_session(engine) as session:
+        yield session
+
+
+@pytest.fixture
+def module_db_savepoint(module_db: Session) -> Generator[None, None, None]:
+    """
+    Undo one test's writes to module_db, committed or not, by rolling back a SAVEPOINT.
+    
+    Module-scoped rows are expired afterwards, so in-memory changes made by
+    the test are reloaded from the database.
+    """
+    module_db.commit()
+    savepoint = module_db.get_bind().begin_nested()
+    
+    yield
+    
+    module_db.rollback()
+    savepoint.rollback()
+    module_db.expire_all()
+
+
+# Categories seeded by db_with_categories (ids come from the model default)
+_SEED_CATEGORIES = (
+    {"name": "Food", "slug": "food", "description": "Food and dining", "icon": "🍔", "sort_order": 1},
+    {"name": "Lodging", "slug": "lodging", "description": "Accommodation", "icon": "🏨", "sort_order": 2},
+    {"name": "Transport", "slug": "transport", "description": "Transportation", "icon": "🚕", "sort_order": 3},
+    {"name": "Tourism", "slug": "tourism", "description": "Tourism and activities", "icon": "🎭", "sort_order": 4},
+    {"name": "Gifts", "slug": "gifts", "description": "Gifts and souvenirs", "icon": "🎁", "sort_order": 5},
+    {"name": "Miscellaneous", "slug": "misc", "description": "Other expenses", "icon": "⚡", "sort_order": 6},
+)
+
+
 @pytest.fixture(scope="function")
 def db_with_categories(db: Session) -> Session:
     """Database session with seeded categories."""
-    categories = [
-        Category(
-            id=uuid.uuid4(),
-            name="Food",
-            slug="food",
-            description="Food and dining",
-            icon="🍔",
-            sort_order=1,
-        ),
-        Category(
-            id=uuid.uuid4(),
-            name="Lodging",
-            slug="lodging",
-            description="Accommodation",
-            icon="🏨",
-            sort_order=2,
-        ),
-        Category(
-            id=uuid.uuid4(),
-            name="Transport",
-            slug="transport",
-            description="Transportation",
-            icon="🚕",
-            sort_order=3,
-        ),
-        Category(
-            id=uuid.uuid4(),
-            name="Tourism",
-            slug="tourism",
-            description="Tourism and activities",
-            icon="🎭",
-            sort_order=4,
-        ),
-        Category(
-            id=uuid.uuid4(),
-            name="Gifts",
-            slug="gifts",
-            description="Gifts and souvenirs",
-            icon="🎁",
-            sort_order=5,
-        ),
-        Category(
-            id=uuid.uuid4(),
-            name="Miscellaneous",
-            slug="misc",
-            description="Other expenses",
-            icon="⚡",
-            sort_order=6,
-        ),
-    ]
-    
-    for cat in categories:
-        db.add(cat)
+    # One bulk INSERT instead of a unit-of-work flush per Category object
+    db.execute(insert(Category), [dict(row) for row in _SEED_CATEGORIES])
     db.commit()
     
     return db
@@ -184,8 +196,7 @@ def sample_user(db: Session) -> User:
         is_active=True,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()
     return user
 
 
@@ -205,8 +216,7 @@ def new_user(db: Session) -> User:
         is_active=True,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()
     return user
 
 
@@ -442,7 +452,6 @@ def create_test_user(
         is_active=True,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    db.flush()
     return user
 
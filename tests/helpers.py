@@ -0,0 +1,15 @@
+"""
+Plain helpers shared by test modules (fixtures live in conftest.py).
+"""
+
+import os
+
+
+# Each pytest-xdist worker ("gw0", "gw1", ...) inserts its own phone numbers,
+# so workers never wait on one another's uncommitted unique-index entries
+_WORKER_NUMBER = int(os.environ.get("PYTEST_XDIST_WORKER", "gw0").removeprefix("gw") or 0)
+
+
+def worker_phone(suffix: str) -> str:
+    """Return a phone number unique to this xdist worker, e.g. "+57300" + "00" + "12222"."""
+    return f"+57300{_WORKER_NUMBER:02d}{suffix}"
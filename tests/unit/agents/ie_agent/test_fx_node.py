@@ -8,6 +8,8 @@ Tests:
 - Error handling when FX lookup fails
 """
 
+from dataclasses import replace
+from datetime import date
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -23,6 +25,35 @@ from app.schemas.extraction import ExtractedExpense
 from app.tools.fx_lookup import FXAPIError, FXRateResult
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared Decimals
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Named after the literal, with "." written as "_" (Decimal("4150.50") -> _D4150_50)
+_D1_08 = Decimal("1.08")
+_D50_00 = Decimal("50.00")
+_D100_00 = Decimal("100.00")
+_D108_00 = Decimal("108.00")
+_D150_00 = Decimal("150.00")
+_D4150_50 = Decimal("4150.50")
+_D207525_00 = Decimal("207525.00")
+_D415050_00 = Decimal("415050.00")
+
+# Fixed rate date: no test compares it with the current day
+_RATE_DATE = date(2025, 1, 15)
+
+# FXRateResult is a plain dataclass: build the USD→COP result once and derive
+# the per-test variants with dataclasses.replace().
+_FX_PROTO = FXRateResult(
+    from_currency="USD",
+    to_currency="COP",
+    rate=_D4150_50,
+    converted_amount=_D415050_00,
+    rate_date=_RATE_DATE,
+    source="api",
+)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Fixtures
 # ─────────────────────────────────────────────────────────────────────────────
@@ -32,7 +63,7 @@ from app.tools.fx_lookup import FXAPIError, FXRateResult
 def mock_extracted_expense():
     """Create a mock extracted expense."""
     expense = MagicMock(spec=ExtractedExpense)
-    expense.amount = Decimal("100.00")
+    expense.amount = _D100_00
     expense.currency = "USD"
     expense.description = "Test expense"
     return expense
@@ -57,16 +88,7 @@ def base_state(mock_extracted_expense):
 @pytest.fixture
 def mock_fx_result():
     """Create a mock FX rate result."""
-    from datetime import date
-
-    return FXRateResult(
-        from_currency="USD",
-        to_currency="COP",
-        rate=Decimal("4150.50"),
-        converted_amount=Decimal("415050.00"),
-        rate_date=date.today(),
-        source="api",
-    )
+    return replace(_FX_PROTO)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -117,7 +139,7 @@ class TestFXNodeSkipCases:
     def test_skip_when_no_expense_currency(self):
         """Should skip when expense currency is not set."""
         expense = MagicMock(spec=ExtractedExpense)
-        expense.amount = Decimal("100.00")
+        expense.amount = _D100_00
         expense.currency = None
 
         state = IEAgentState(
@@ -148,7 +170,7 @@ class TestSameCurrency:
     def test_same_currency_sets_amount_directly(self):
         """Same currency should set amount_in_home_currency directly."""
         expense = MagicMock(spec=ExtractedExpense)
-        expense.amount = Decimal("150.00")
+        expense.amount = _D150_00
         expense.currency = "COP"
 
         state = IEAgentState(
@@ -171,7 +193,7 @@ class TestSameCurrency:
     def test_same_currency_case_insensitive(self):
         """Currency comparison should be case-insensitive."""
         expense = MagicMock(spec=ExtractedExpense)
-        expense.amount = Decimal("100.00")
+        expense.amount = _D100_00
         expense.currency = "cop"  # lowercase
 
         state = IEAgentState(
@@ -302,7 +324,7 @@ class TestAsyncNode:
     async def test_async_node_skip_same_currency(self):
         """Async node should skip when currencies match."""
         expense = MagicMock(spec=ExtractedExpense)
-        expense.amount = Decimal("100.00")
+        expense.amount = _D100_00
         expense.currency = "COP"
 
         state = IEAgentState(
@@ -333,7 +355,7 @@ class TestFXNodeIntegration:
     def test_usd_to_cop_conversion(self, mock_fx_result):
         """Test USD to COP conversion flow."""
         expense = MagicMock(spec=ExtractedExpense)
-        expense.amount = Decimal("50.00")
+        expense.amount = _D50_00
         expense.currency = "USD"
 
         state = IEAgentState(
@@ -349,15 +371,9 @@ class TestFXNodeIntegration:
         )
 
         # Create result for $50 USD
-        from datetime import date
-
-        fx_result = FXRateResult(
-            from_currency="USD",
-            to_currency="COP",
-            rate=Decimal("4150.50"),
-            converted_amount=Decimal("207525.00"),  # 50 * 4150.50
-            rate_date=date.today(),
-            source="api",
+        fx_result = replace(
+            _FX_PROTO,
+            converted_amount=_D207525_00,  # 50 * 4150.50
         )
 
         with patch(
@@ -368,15 +384,13 @@ class TestFXNodeIntegration:
 
             result = lookup_fx_rate_node(state)
 
-            assert result.get("fx_conversion").rate == Decimal("4150.50")
+            assert result.get("fx_conversion").rate == _D4150_50
             assert result.get("amount_in_home_currency") == 207525.00
 
     def test_eur_to_usd_conversion(self):
         """Test EUR to USD conversion flow."""
-        from datetime import date
-
         expense = MagicMock(spec=ExtractedExpense)
-        expense.amount = Decimal("100.00")
+        expense.amount = _D100_00
         expense.currency = "EUR"
 
         state = IEAgentState(
@@ -391,13 +405,12 @@ class TestFXNodeIntegration:
             errors=[],
         )
 
-        fx_result = FXRateResult(
+        fx_result = replace(
+            _FX_PROTO,
             from_currency="EUR",
             to_currency="USD",
-            rate=Decimal("1.08"),
-            converted_amount=Decimal("108.00"),
-            rate_date=date.today(),
-            source="api",
+            rate=_D1_08,
+            converted_amount=_D108_00,
         )
 
         with patch(
@@ -408,7 +421,7 @@ class TestFXNodeIntegration:
 
             result = lookup_fx_rate_node(state)
 
-            assert result.get("fx_conversion").rate == Decimal("1.08")
+            assert result.get("fx_conversion").rate == _D1_08
             assert result.get("amount_in_home_currency") == 108.00
 
 
@@ -12,6 +12,7 @@ from app.agents.configuration_agent.state import (
 from app.agents.configuration_agent.nodes.intent import (
     _quick_intent_detection,
     _parse_llm_response,
+    _drop_redundant_substrings,
 )
 from app.agents.configuration_agent.nodes.processor import (
     _parse_amount,
@@ -142,6 +143,21 @@ class TestQuickIntentDetection:
         assert result is not None
         assert result["intent"] == "budget_create"
 
+    def test_repeated_calls_return_independent_dicts(self):
+        """Cached detections should not share entity dicts between callers."""
+        first = _quick_intent_detection("Ana", "onboarding", "name")
+        first["entities"]["name"] = "changed"
+        
+        second = _quick_intent_detection("Ana", "onboarding", "name")
+        
+        assert second == {"intent": "onboarding_provide_name", "entities": {"name": "Ana"}}
+
+    def test_redundant_substrings_are_dropped(self):
+        """Words containing a shorter word of the same set add nothing to any()."""
+        probes = _drop_redundant_substrings(("presupuesto", "budget", "configurar presupuesto"))
+        
+        assert probes == ("presupuesto", "budget")
+
 
 class TestParseLlmResponse:
     """Tests for LLM response parsing."""
@@ -175,6 +191,14 @@ class TestParseLlmResponse:
         
         assert result["intent"] == "unknown"
 
+    def test_returns_unknown_for_malformed_json_object(self):
+        """Should return unknown when the braces hold malformed JSON."""
+        content = '```json\n{"intent": "budget_create", "entities": }\n```'
+        
+        result = _parse_llm_response(content)
+        
+        assert result["intent"] == "unknown"
+
 
 class TestParseAmount:
     """Tests for amount parsing."""
@@ -194,6 +218,12 @@ class TestParseAmount:
         assert _parse_amount("1,500,000") == "1500000"
         assert _parse_amount("1.500.000") == "1500000"
 
+    def test_keeps_only_digits(self):
+        """Should drop currency codes, spaces and other non-digit characters."""
+        assert _parse_amount("COP 1 500 000") == "1500000"
+        assert _parse_amount("S/. 250") == "250"
+        assert _parse_amount("abc") == "0"
+
     def test_handles_empty_input(self):
         """Should return 0 for empty input."""
         assert _parse_amount("") == "0"
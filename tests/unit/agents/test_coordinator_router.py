@@ -8,7 +8,6 @@ Tests the intent detection logic including:
 """
 
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 
 from app.agents.common.intents import (
     AgentType,
@@ -18,6 +17,7 @@ from app.agents.common.intents import (
     EXPENSE_KEYWORDS,
     QUERY_KEYWORDS,
     CONFIG_KEYWORDS,
+    _count_keyword_categories,
 )
 from app.agents.coordinator.router import (
     IntentRouter,
@@ -29,6 +29,16 @@ from app.agents.coordinator.router import (
 )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Fixtures
+# ─────────────────────────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="module")
+def router():
+    """Create one router instance shared by the module (it holds no per-call state)."""
+    return IntentRouter()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Test: Coordinator Commands
 # ─────────────────────────────────────────────────────────────────────────────
@@ -81,6 +91,18 @@ class TestCoordinatorCommands:
         is_cmd, action = is_coordinator_command("¿Cuánto gasté?")
         assert is_cmd is False
         assert action is None
+    
+    def test_command_with_surrounding_whitespace(self):
+        """Test commands are matched after stripping and lowercasing."""
+        is_cmd, action = is_coordinator_command("  CANCELAR \n")
+        assert is_cmd is True
+        assert action == "cancel_current_flow"
+    
+    def test_long_message_starting_with_command(self):
+        """Test that a command word inside a longer message is not a command."""
+        is_cmd, action = is_coordinator_command("cancelar la compra de ayer por favor")
+        assert is_cmd is False
+        assert action is None
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -151,6 +173,29 @@ class TestKeywordCounting:
         """Test counting config keywords."""
         assert count_keywords("crear nuevo viaje", CONFIG_KEYWORDS) >= 2
         assert count_keywords("cuánto gasté", CONFIG_KEYWORDS) == 0
+    
+    def test_single_pass_matches_per_category_counts(self):
+        """Test the combined scan agrees with count_keywords per category."""
+        for message in [
+            "gastos de hotel con tarjeta",
+            "cuánto me queda del presupuesto para el viaje",
+            "nueva card, crear viaje",
+            "hola mundo",
+        ]:
+            assert _count_keyword_categories(message) == (
+                count_keywords(message, EXPENSE_KEYWORDS),
+                count_keywords(message, QUERY_KEYWORDS),
+                count_keywords(message, CONFIG_KEYWORDS),
+            )
+
+    def test_early_stop_keeps_winning_category(self):
+        """Test stopping the scan early never changes which category wins."""
+        message = "gasté 20 soles en taxi y uber con tarjeta"
+        expense, query, config = _count_keyword_categories(message, stop_when_decided=True)
+
+        assert expense >= 2
+        assert expense > query and expense > config
+        assert detect_intent_fast(message) == AgentType.IE
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -160,11 +205,6 @@ class TestKeywordCounting:
 class TestIntentRouter:
     """Test the IntentRouter class."""
     
-    @pytest.fixture
-    def router(self):
-        """Create a router instance."""
-        return IntentRouter()
-    
     @pytest.mark.asyncio
     async def test_route_command(self, router):
         """Test routing coordinator commands."""
@@ -224,21 +264,26 @@ class TestIntentRouter:
         assert result.method == "keyword"
     
     @pytest.mark.asyncio
-    async def test_route_llm_fallback(self, router):
+    async def test_route_llm_fallback(self, router, monkeypatch):
         """Test that ambiguous messages fall back to LLM."""
-        # Mock the LLM response
-        with patch.object(router, '_route_with_llm', new_callable=AsyncMock) as mock_llm:
-            mock_llm.return_value = RoutingResult(
+        calls = []
+        
+        # Stand in for the LLM with a plain coroutine
+        async def fake_route_with_llm(*args, **kwargs):
+            calls.append(args)
+            return RoutingResult(
                 agent=AgentType.COACH,
                 confidence=0.75,
                 method="llm",
                 reason="LLM classification",
             )
-            
-            result = await router.route("Hola, buenos días")
-            
-            assert result.method == "llm"
-            mock_llm.assert_called_once()
+        
+        monkeypatch.setattr(router, "_route_with_llm", fake_route_with_llm)
+        
+        result = await router.route("Hola, buenos días")
+        
+        assert result.method == "llm"
+        assert len(calls) == 1
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -248,11 +293,6 @@ class TestIntentRouter:
 class TestIntentChangeDetection:
     """Test intent change detection for sticky sessions."""
     
-    @pytest.fixture
-    def router(self):
-        """Create a router instance."""
-        return IntentRouter()
-    
     @pytest.mark.asyncio
     async def test_command_always_changes(self, router):
         """Test that commands always trigger change."""
@@ -351,7 +391,13 @@ class TestEdgeCases:
         assert detect_intent_fast("GASTÉ 50 SOLES") == AgentType.IE
         # "Cuánto Gasté" has 1 query + 1 expense keyword = ambiguous
         assert detect_intent_fast("CUÁNTO GASTÉ ESTE MES") == AgentType.COACH
-    
+
+    def test_case_and_padding_variants_agree(self):
+        """Test cached detection treats case/whitespace variants alike."""
+        assert detect_intent_fast("  Cancelar ") == AgentType.COORDINATOR
+        assert detect_intent_fast("cancelar") == AgentType.COORDINATOR
+        assert detect_intent_fast("\tNUEVO VIAJE\n") == AgentType.IVR
+
     def test_special_characters(self):
         """Test messages with special characters."""
         assert detect_intent_fast("¡Gasté 50 soles!") == AgentType.IE
@@ -415,6 +461,17 @@ class TestRoutingResult:
         assert d["method"] == "keyword"
         assert d["reason"] == "Detected expense"
 
+    def test_is_immutable(self):
+        """Test routing results cannot be modified after creation."""
+        result = RoutingResult(
+            agent=AgentType.IE,
+            confidence=0.85,
+            method="keyword",
+        )
+
+        with pytest.raises(AttributeError):
+            result.agent = AgentType.COACH
+
 
 class TestIntentChangeResult:
     """Test IntentChangeResult dataclass."""
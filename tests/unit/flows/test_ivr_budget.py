@@ -14,24 +14,33 @@ from sqlalchemy.orm import Session
 from app.flows.ivr_processor import IVRProcessor, IVRResponse
 from app.models.user import User
 from app.models.budget import Budget
+from tests.helpers import worker_phone
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Fixtures
 # ─────────────────────────────────────────────────────────────────────────────
 
-@pytest.fixture
-def ivr_processor(db: Session) -> IVRProcessor:
+# Budget period for steps that only carry the dates along (no clock needed)
+_PERIOD_START = "2025-02-01"
+_PERIOD_END = "2025-03-03"
+
+# Tests share module_db and onboarded_user; roll back each test's writes
+pytestmark = pytest.mark.usefixtures("module_db_savepoint")
+
+
+@pytest.fixture(scope="module")
+def ivr_processor(module_db: Session) -> IVRProcessor:
     """Create an IVR processor with test database."""
-    return IVRProcessor(db)
+    return IVRProcessor(module_db)
 
 
-@pytest.fixture
-def onboarded_user(db: Session) -> User:
+@pytest.fixture(scope="module")
+def onboarded_user(module_db: Session) -> User:
     """Create an onboarded user for budget tests."""
     user = User(
         id=uuid.uuid4(),
-        phone_number="+573001234567",
+        phone_number=worker_phone("24567"),
         full_name="Budget Test User",
         nickname="Budget",
         home_currency="COP",
@@ -42,9 +51,9 @@ def onboarded_user(db: Session) -> User:
         onboarding_completed_at=datetime.utcnow(),
         is_active=True,
     )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
+    module_db.add(user)
+    module_db.commit()
+    module_db.refresh(user)
     return user
 
 
@@ -238,7 +247,7 @@ class TestBudgetDateSteps:
                 "name": "Test",
                 "amount": "5000000",
                 "currency": "COP",
-                "start_date": date.today().isoformat(),
+                "start_date": _PERIOD_START,
             },
         )
 
@@ -247,6 +256,7 @@ class TestBudgetDateSteps:
 
     def test_end_date_30_days(self, ivr_processor: IVRProcessor, onboarded_user: User):
         """Selecting '2' for end date should use 30 days from today."""
+        today = date.today()
         response = ivr_processor.process_budget_creation(
             user=onboarded_user,
             current_step="end_date",
@@ -255,12 +265,12 @@ class TestBudgetDateSteps:
                 "name": "Test",
                 "amount": "5000000",
                 "currency": "COP",
-                "start_date": date.today().isoformat(),
+                "start_date": today.isoformat(),
             },
         )
 
         assert response.next_step == "confirm"
-        expected_end = (date.today() + timedelta(days=30)).isoformat()
+        expected_end = (today + timedelta(days=30)).isoformat()
         assert response.data.get("end_date") == expected_end
 
 
@@ -277,8 +287,8 @@ class TestBudgetConfirmation:
             "name": "Test Budget",
             "amount": "5000000",
             "currency": "COP",
-            "start_date": date.today().isoformat(),
-            "end_date": (date.today() + timedelta(days=30)).isoformat(),
+            "start_date": _PERIOD_START,
+            "end_date": _PERIOD_END,
         }
 
         response = ivr_processor.process_budget_creation(
@@ -298,8 +308,8 @@ class TestBudgetConfirmation:
             "name": "Test Budget",
             "amount": "5000000",
             "currency": "COP",
-            "start_date": date.today().isoformat(),
-            "end_date": (date.today() + timedelta(days=30)).isoformat(),
+            "start_date": _PERIOD_START,
+            "end_date": _PERIOD_END,
         }
 
         response = ivr_processor.process_budget_creation(
@@ -320,15 +330,8 @@ class TestBudgetConfirmation:
 class TestBudgetFullFlow:
     """Tests for complete budget creation flow."""
 
-    def test_full_budget_creation_flow(
-        self, ivr_processor: IVRProcessor, onboarded_user: User, db_with_categories: Session
-    ):
+    def test_full_budget_creation_flow(self, ivr_processor: IVRProcessor, onboarded_user: User):
         """Complete budget flow should work end-to-end."""
-        db = db_with_categories
-        
-        # Update processor with correct db
-        ivr_processor.db = db
-
         # Step 1: Start
         response = ivr_processor.process_budget_creation(
             user=onboarded_user,
@@ -242,6 +242,12 @@ class TestValidateAmount:
         assert result.valid is True
         assert result.value == Decimal("100")
 
+    def test_valid_digits_with_padding(self):
+        """Plain digits with surrounding whitespace should pass."""
+        result = validate_amount("  2500000\n")
+        assert result.valid is True
+        assert result.value == Decimal("2500000")
+
     def test_invalid_zero(self):
         """Zero should fail."""
         result = validate_amount("0")
@@ -23,6 +23,22 @@ from app.tools.fx_lookup import (
 )
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Shared Decimals
+# ─────────────────────────────────────────────────────────────────────────────
+
+# Named after the literal, with "." written as "_" (Decimal("4150.50") -> _D4150_50)
+_D0_92 = Decimal("0.92")
+_D1 = Decimal("1")
+_D17_25 = Decimal("17.25")
+_D50 = Decimal("50")
+_D75 = Decimal("75")
+_D92_00 = Decimal("92.00")
+_D100 = Decimal("100")
+_D4150_50 = Decimal("4150.50")
+_D415050_00 = Decimal("415050.00")
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Fixtures
 # ─────────────────────────────────────────────────────────────────────────────
@@ -64,8 +80,8 @@ class TestFXRateResult:
         result = FXRateResult(
             from_currency="USD",
             to_currency="COP",
-            rate=Decimal("4150.50"),
-            converted_amount=Decimal("415050.00"),
+            rate=_D4150_50,
+            converted_amount=_D415050_00,
             rate_date=date(2026, 1, 30),
             source="api",
         )
@@ -86,7 +102,7 @@ class TestFXRateResult:
         result = FXRateResult(
             from_currency="USD",
             to_currency="EUR",
-            rate=Decimal("0.92"),
+            rate=_D0_92,
             converted_amount=None,
             rate_date=date(2026, 1, 30),
             source="cache",
@@ -108,26 +124,26 @@ class TestSameCurrency:
     @pytest.mark.asyncio
     async def test_same_currency_returns_identity(self, fx_lookup):
         """Same currency should return rate of 1."""
-        result = await fx_lookup.get_rate("USD", "USD", Decimal("100"))
+        result = await fx_lookup.get_rate("USD", "USD", _D100)
 
-        assert result.rate == Decimal("1")
-        assert result.converted_amount == Decimal("100")
+        assert result.rate == _D1
+        assert result.converted_amount == _D100
         assert result.source == "identity"
 
     @pytest.mark.asyncio
     async def test_same_currency_case_insensitive(self, fx_lookup):
         """Currency comparison should be case-insensitive."""
-        result = await fx_lookup.get_rate("usd", "USD", Decimal("50"))
+        result = await fx_lookup.get_rate("usd", "USD", _D50)
 
-        assert result.rate == Decimal("1")
-        assert result.converted_amount == Decimal("50")
+        assert result.rate == _D1
+        assert result.converted_amount == _D50
 
     @pytest.mark.asyncio
     async def test_same_currency_with_whitespace(self, fx_lookup):
         """Currency comparison should trim whitespace."""
-        result = await fx_lookup.get_rate(" USD ", "  USD", Decimal("75"))
+        result = await fx_lookup.get_rate(" USD ", "  USD", _D75)
 
-        assert result.rate == Decimal("1")
+        assert result.rate == _D1
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -145,10 +161,10 @@ class TestCache:
         mock_redis.get.return_value = "4150.50"
 
         fx_lookup = FXLookup(redis_client=mock_redis)
-        result = await fx_lookup.get_rate("USD", "COP", Decimal("100"))
+        result = await fx_lookup.get_rate("USD", "COP", _D100)
 
-        assert result.rate == Decimal("4150.50")
-        assert result.converted_amount == Decimal("415050.00")
+        assert result.rate == _D4150_50
+        assert result.converted_amount == _D415050_00
         assert result.source == "cache"
 
         # Verify cache was queried
@@ -186,7 +202,7 @@ class TestCache:
 
         # Mock the API call
         with patch.object(fx_lookup, "_fetch_rate_from_api", new_callable=AsyncMock) as mock_api:
-            mock_api.return_value = Decimal("4150.50")
+            mock_api.return_value = _D4150_50
 
             # First call - should hit API
             result1 = await fx_lookup.get_rate("USD", "COP")
@@ -206,7 +222,7 @@ class TestCache:
         fx_lookup = FXLookup(redis_client=mock_redis)
 
         with patch.object(fx_lookup, "_fetch_rate_from_api", new_callable=AsyncMock) as mock_api:
-            mock_api.return_value = Decimal("4150.50")
+            mock_api.return_value = _D4150_50
 
             await fx_lookup.get_rate("USD", "COP")
 
@@ -231,12 +247,12 @@ class TestAPICall:
         FXLookup._memory_cache.clear()
 
         with patch.object(fx_lookup, "_fetch_rate_from_api", new_callable=AsyncMock) as mock_api:
-            mock_api.return_value = Decimal("4150.50")
+            mock_api.return_value = _D4150_50
 
-            result = await fx_lookup.get_rate("USD", "COP", Decimal("100"))
+            result = await fx_lookup.get_rate("USD", "COP", _D100)
 
-            assert result.rate == Decimal("4150.50")
-            assert result.converted_amount == Decimal("415050.00")
+            assert result.rate == _D4150_50
+            assert result.converted_amount == _D415050_00
             assert result.source == "api"
             mock_api.assert_called_once_with("USD", "COP")
 
@@ -262,12 +278,12 @@ class TestAPICall:
     async def test_get_rate_with_amount_conversion(self, fx_lookup):
         """Should correctly convert amount."""
         with patch.object(fx_lookup, "_fetch_rate_from_api", new_callable=AsyncMock) as mock_api:
-            mock_api.return_value = Decimal("0.92")
+            mock_api.return_value = _D0_92
 
-            result = await fx_lookup.get_rate("USD", "EUR", Decimal("100"))
+            result = await fx_lookup.get_rate("USD", "EUR", _D100)
 
-            assert result.rate == Decimal("0.92")
-            assert result.converted_amount == Decimal("92.00")
+            assert result.rate == _D0_92
+            assert result.converted_amount == _D92_00
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -282,22 +298,22 @@ class TestConvertMethod:
     async def test_convert_basic(self, fx_lookup):
         """Test basic amount conversion."""
         with patch.object(fx_lookup, "_fetch_rate_from_api", new_callable=AsyncMock) as mock_api:
-            mock_api.return_value = Decimal("4150.50")
+            mock_api.return_value = _D4150_50
 
             result = await fx_lookup.convert(
-                Decimal("100"),
+                _D100,
                 "USD",
                 "COP",
             )
 
-            assert result == Decimal("415050.00")
+            assert result == _D415050_00
 
     @pytest.mark.asyncio
     async def test_convert_same_currency(self, fx_lookup):
         """Convert same currency should return original amount."""
-        result = await fx_lookup.convert(Decimal("100"), "USD", "USD")
+        result = await fx_lookup.convert(_D100, "USD", "USD")
 
-        assert result == Decimal("100")
+        assert result == _D100
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -315,11 +331,11 @@ class TestMultipleRates:
             # Return different rates for different currencies
             async def mock_fetch(from_curr, to_curr):
                 rates = {
-                    "COP": Decimal("4150.50"),
-                    "EUR": Decimal("0.92"),
-                    "MXN": Decimal("17.25"),
+                    "COP": _D4150_50,
+                    "EUR": _D0_92,
+                    "MXN": _D17_25,
                 }
-                return rates.get(to_curr, Decimal("1"))
+                return rates.get(to_curr, _D1)
 
             mock_api.side_effect = mock_fetch
 
@@ -329,9 +345,9 @@ class TestMultipleRates:
             )
 
             assert len(results) == 3
-            assert results["COP"].rate == Decimal("4150.50")
-            assert results["EUR"].rate == Decimal("0.92")
-            assert results["MXN"].rate == Decimal("17.25")
+            assert results["COP"].rate == _D4150_50
+            assert results["EUR"].rate == _D0_92
+            assert results["MXN"].rate == _D17_25
 
     @pytest.mark.asyncio
     async def test_get_multiple_rates_partial_failure(self, fx_lookup):
@@ -340,7 +356,7 @@ class TestMultipleRates:
             async def mock_fetch(from_curr, to_curr):
                 if to_curr == "INVALID":
                     raise FXRateNotFoundError("Not found")
-                return Decimal("4150.50")
+                return _D4150_50
 
             mock_api.side_effect = mock_fetch
 
@@ -430,7 +446,7 @@ class TestErrorHandling:
 
         # The cache error is caught and logged, not raised
         with patch.object(fx, "_fetch_rate_from_api", new_callable=AsyncMock) as mock_api:
-            mock_api.return_value = Decimal("4150.50")
+            mock_api.return_value = _D4150_50
 
             # Should not raise despite Redis error
             import asyncio
@@ -438,7 +454,7 @@ class TestErrorHandling:
                 fx.get_rate("USD", "COP")
             )
 
-            assert result.rate == Decimal("4150.50")
+            assert result.rate == _D4150_50
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -455,11 +471,11 @@ class TestRealAPI:
         """Test real API call - requires EXCHANGE_RATE_API_KEY."""
         fx_lookup = FXLookup()
 
-        result = await fx_lookup.get_rate("USD", "COP", Decimal("100"))
+        result = await fx_lookup.get_rate("USD", "COP", _D100)
 
         # Basic sanity checks
         assert result.rate > 0
         assert result.converted_amount is not None
-        assert result.converted_amount > Decimal("100")  # COP is worth less than USD
+        assert result.converted_amount > _D100  # COP is worth less than USD
         assert result.source in ("api", "cache")
 